@@ -1,10 +1,161 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from dataclasses import dataclass
 from datetime import datetime
+import concurrent.futures as cf
+from functools import lru_cache, partial
 import yfinance as yf
 import os
+import sys
+import tempfile
+import time
+
+# Balance sheet items used by the ratios and plots, in gather order
+BALANCE_SHEET_ITEMS = [
+    'Current Assets',
+    'Current Liabilities',
+    'Inventory',
+    'Total Assets',
+    'Total Liabilities Net Minority Interest',
+    'Stockholders Equity',
+    'Total Non Current Assets',
+    'Total Non Current Liabilities Net Minority Interest'
+]
+
+@dataclass
+class BalanceSheet:
+    """Quarterly balance sheet kept as one contiguous (items x dates) float32 array"""
+    dates: np.ndarray  # datetime64 quarter-end dates, latest first
+    label_idx: dict  # Item label -> row in values
+    values: np.ndarray  # (items x dates) float32
+    
+    @classmethod
+    def from_frame(cls, df):
+        """Build from a yfinance balance sheet DataFrame with items as rows"""
+        return cls(pd.to_datetime(df.columns).to_numpy(),
+                   {label: i for i, label in enumerate(df.index)},
+                   df.to_numpy(dtype=np.float32))
+    
+    @property
+    def labels(self):
+        """Available balance sheet items, in row order"""
+        return list(self.label_idx)
+
+# Ratio columns, in the order returned by _ratios_kernel and stored in ratios_arr
+RATIO_COLUMNS = ['Current_Ratio', 'Quick_Ratio', 'Debt_to_Assets', 'Equity_Multiplier']
+
+# Quarterly balance sheets change rarely, so cached copies are reused for a day
+CACHE_TTL = 24 * 60 * 60  # seconds
+
+def _pyplot():
+    """Import pyplot on first use, so fetching and reporting don't pay for it"""
+    import matplotlib
+    # Plots are only written to disk, so default to the headless backend, but
+    # leave the backend alone if pyplot is already in use (e.g. in a notebook)
+    if 'matplotlib.pyplot' not in sys.modules:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def _fetch_one(company, cache_dir):
+    """Fetch one company's quarterly balance sheet, returning (company, bs, error)
+    
+    A Parquet copy in cache_dir younger than CACHE_TTL is used instead of Yahoo
+    Finance; an unreadable copy is ignored and refetched. The cache is only
+    written right after a network fetch, so its mtime is the age of the data.
+    Balance sheets are stored transposed, since Parquet needs string column names.
+    """
+    cache_path = os.path.join(cache_dir, f'{company}.parquet')
+    if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < CACHE_TTL:
+        try:
+            return company, pd.read_parquet(cache_path, engine='pyarrow').T, None
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache for {company}: {str(e)}")
+            
+    try:
+        bs = yf.Ticker(company).quarterly_balance_sheet  # Use quarterly data
+    except Exception as e:
+        return company, None, e
+        
+    if not bs.empty:
+        # Write to a temporary file first so an interrupted run never leaves
+        # a partial cache file behind
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            bs.T.to_parquet(tmp_path, engine='pyarrow')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Unable to cache data for {company}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return company, bs, None
+
+def _gather_items(bs, required=()):
+    """Gather BALANCE_SHEET_ITEMS rows into a single (items x dates) array
+    
+    Items not present in the balance sheet come back as NaN rows; a KeyError
+    is raised if any of the required items are missing.
+    """
+    missing = [item for item in required if item not in bs.label_idx]
+    if missing:
+        raise KeyError(missing)
+    items = np.full((len(BALANCE_SHEET_ITEMS), len(bs.dates)), np.nan, dtype=bs.values.dtype)
+    for i, item in enumerate(BALANCE_SHEET_ITEMS):
+        if item in bs.label_idx:
+            items[i] = bs.values[bs.label_idx[item]]
+    return items
+
+# Row count from which the numba-compiled ratio loop beats the NumPy kernel
+JIT_MIN_ROWS = 100_000
+
+def _ratios_loop(a):
+    """Row-by-row ratio calculation, compiled by _ratios_jit"""
+    n = a.shape[0]
+    out = np.empty((n, 4), dtype=a.dtype)
+    for i in range(n):
+        ca, cl, inv, ta, tl, se = a[i, 0], a[i, 1], a[i, 2], a[i, 3], a[i, 4], a[i, 5]
+        out[i, 0] = ca / cl
+        out[i, 1] = (ca - inv) / cl
+        out[i, 2] = tl / ta
+        out[i, 3] = ta / se
+    return out
+
+@lru_cache(maxsize=None)
+def _ratios_jit():
+    """Compile _ratios_loop with numba on first use, or None if numba is not installed"""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; the NumPy kernel is used instead
+        return None
+    # The numpy error model returns inf/NaN on division by zero, like NumPy,
+    # instead of raising ZeroDivisionError
+    return njit(cache=True, error_model='numpy')(_ratios_loop)
+
+def _ratios_numpy(a):
+    """Vectorized NumPy ratio calculation, used below JIT_MIN_ROWS"""
+    ca, cl, inv, ta, tl, se = a.T
+    # Zero or missing items give inf/NaN ratios, which is expected here
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.column_stack((ca / cl, (ca - inv) / cl, tl / ta, ta / se))
+
+def _ratios_kernel(a):
+    """Compute ratios from an (n, 6) array of current assets, current liabilities,
+    inventory, total assets, total liabilities and stockholders equity
+    
+    Returns an (n, 4) array of current ratio, quick ratio, debt to assets and
+    equity multiplier. Inputs of at least JIT_MIN_ROWS rows go through the
+    numba-compiled loop when numba is available.
+    """
+    if len(a) >= JIT_MIN_ROWS:
+        ratios_jit = _ratios_jit()
+        if ratios_jit is not None:
+            return ratios_jit(a)
+    return _ratios_numpy(a)
+
+def _radar_pad(a):
+    """Close each row of an (n, k) array into a polygon by repeating its first value"""
+    return np.concatenate((a, a[:, :1]), axis=1)
 
 class FinancialAnalysis:
     def __init__(self, companies):
@@ -17,6 +168,8 @@ class FinancialAnalysis:
         self.companies = companies
         self.balance_sheets = {}
         self.ratios = {}
+        self.ratios_arr = {}  # Same ratios as (dates x RATIO_COLUMNS) arrays
+        self._fig = None
         
         # Get the directory path of main.py
         self.base_path = os.path.dirname(os.path.abspath(__file__))
@@ -29,6 +182,10 @@ class FinancialAnalysis:
         self.plots_dir = os.path.join(self.output_dir, 'plots')
         os.makedirs(self.plots_dir, exist_ok=True)
         
+        # Create balance sheet cache directory
+        self.cache_dir = os.path.join(self.output_dir, 'cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
     def get_output_path(self, filename):
         """Get the full path for output files"""
         return os.path.join(self.output_dir, filename)
@@ -37,107 +194,120 @@ class FinancialAnalysis:
         """Get the full path for plot files"""
         return os.path.join(self.plots_dir, filename)
         
-    def fetch_data(self, period='5y'):
-        """Fetch balance sheet data from Yahoo Finance"""
-        for company in self.companies:
-            try:
-                stock = yf.Ticker(company)
-                bs = stock.quarterly_balance_sheet  # Use quarterly data
+    def get_figure(self, figsize):
+        """Get the shared figure, cleared and resized for the next plot"""
+        if self._fig is None:
+            self._fig = _pyplot().figure()
+        self._fig.clear()
+        self._fig.set_size_inches(figsize)
+        return self._fig
+        
+    def fetch_data(self, period='5y', verbose=False):
+        """
+        Fetch balance sheet data from Yahoo Finance
+        
+        Parameters:
+        verbose (bool): Print the available balance sheet items for each company
+        """
+        # Issue at most one request per distinct symbol, preserving order
+        symbols = list(dict.fromkeys(self.companies))
+        if not symbols:
+            return
+            
+        # Requests are I/O-bound, so overlap them across a thread pool
+        with cf.ThreadPoolExecutor(max_workers=min(32, len(symbols))) as ex:
+            for company, bs, error in ex.map(partial(_fetch_one, cache_dir=self.cache_dir), symbols):
+                if error is not None:
+                    print(f"Error fetching data for {company}: {str(error)}")
+                    continue
                 if bs.empty:
                     print(f"Warning: Unable to fetch data for {company}")
                     continue
-                print(f"\n{company} Balance Sheet Available Items:")
-                print(bs.index.tolist())
-                self.balance_sheets[company] = bs
-            except Exception as e:
-                print(f"Error fetching data for {company}: {str(e)}")
+                if verbose:
+                    print(f"\n{company} Balance Sheet Available Items:")
+                    print(bs.index.tolist())
+                # Keep only the float32 values and labels; float32 keeps ample
+                # precision for ratios and plots at a fraction of the memory
+                try:
+                    self.balance_sheets[company] = BalanceSheet.from_frame(bs)
+                except Exception as e:
+                    print(f"Error fetching data for {company}: {str(e)}")
                 
-    def calculate_financial_ratios(self):
-        """Calculate key financial ratios"""
+    def calculate_financial_ratios(self, verbose=False):
+        """
+        Calculate key financial ratios
+        
+        Parameters:
+        verbose (bool): Print the available balance sheet items for each company,
+            not only for those missing required items
+        """
+        required = ['Current Assets', 'Current Liabilities', 'Total Assets',
+                    'Total Liabilities Net Minority Interest', 'Stockholders Equity']
+        valid = {}
         for company, bs in self.balance_sheets.items():
-            try:
-                # Create DataFrame to store ratios
-                ratios = pd.DataFrame(index=bs.columns)
-                
-                # Current Ratio = Current Assets / Current Liabilities
-                current_assets = bs.loc['Current Assets']
-                current_liabilities = bs.loc['Current Liabilities']
-                ratios['Current_Ratio'] = current_assets / current_liabilities
-                
-                # Quick Ratio = (Current Assets - Inventory) / Current Liabilities
-                if 'Inventory' in bs.index:
-                    inventory = bs.loc['Inventory']
-                else:
-                    inventory = 0  # Assume 0 if no inventory data
-                ratios['Quick_Ratio'] = (current_assets - inventory) / current_liabilities
-                
-                # Debt to Assets Ratio = Total Liabilities / Total Assets
-                total_assets = bs.loc['Total Assets']
-                total_liabilities = bs.loc['Total Liabilities Net Minority Interest']
-                ratios['Debt_to_Assets'] = total_liabilities / total_assets
-                
-                # Equity Multiplier = Total Assets / Stockholders Equity
-                stockholders_equity = bs.loc['Stockholders Equity']
-                ratios['Equity_Multiplier'] = total_assets / stockholders_equity
-                
-                self.ratios[company] = ratios
-                print(f"Financial ratios calculation completed for {company}")
-                
-            except Exception as e:
-                print(f"Error calculating ratios for {company}: {str(e)}")
+            missing = [item for item in required if item not in bs.label_idx]
+            if missing:
+                print(f"Error calculating ratios for {company}: missing {missing}")
                 print("Available balance sheet items:")
-                print(bs.index.tolist())
+                print(bs.labels)
+                continue
+            if verbose:
+                print(f"\n{company} Balance Sheet Available Items:")
+                print(bs.labels)
+            valid[company] = bs
+        if not valid:
+            return
+            
+        # Place every company's quarters side by side so all ratios are
+        # computed in a single pass over one array
+        blocks = []
+        for bs in valid.values():
+            block = _gather_items(bs)[:6]
+            if 'Inventory' not in bs.label_idx:
+                block[2] = 0  # Assume 0 if no inventory data
+            blocks.append(block)
+        items = np.concatenate(blocks, axis=1)
+        
+        all_ratios = _ratios_kernel(np.ascontiguousarray(items.T, dtype=np.float32))
+        
+        # Split the rows back per company
+        splits = np.cumsum([len(bs.dates) for bs in valid.values()])[:-1]
+        for (company, bs), ratios_arr in zip(valid.items(), np.split(all_ratios, splits)):
+            self.ratios[company] = pd.DataFrame(ratios_arr, index=pd.DatetimeIndex(bs.dates),
+                                                columns=RATIO_COLUMNS)
+            self.ratios_arr[company] = ratios_arr
+            print(f"Financial ratios calculation completed for {company}")
     
-    def plot_current_ratio_comparison(self):
-        """Plot current ratio comparison chart"""
-        plt.figure(figsize=(12, 6))
+    def _draw_current_ratio(self, ax):
+        """Draw the current ratio comparison on the given axes"""
         for company in self.companies:
             if company in self.ratios:
-                # Convert date index to datetime format
-                dates = pd.to_datetime(self.ratios[company].index)
-                values = self.ratios[company]['Current_Ratio']
-                plt.plot(dates, values, marker='o', label=company)
+                ratios = self.ratios[company]
+                ax.plot(ratios.index, ratios['Current_Ratio'], marker='o', label=company)
         
-        plt.title('Current Ratio Comparison', fontsize=14)
-        plt.xlabel('Date', fontsize=12)
-        plt.ylabel('Current Ratio', fontsize=12)
-        plt.legend(fontsize=10)
-        plt.grid(True)
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        
-        plot_path = self.get_plot_path('current_ratio_comparison.png')
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return plot_path
+        ax.set_title('Current Ratio Comparison', fontsize=14)
+        ax.set_xlabel('Date', fontsize=12)
+        ax.set_ylabel('Current Ratio', fontsize=12)
+        ax.legend(fontsize=10)
+        ax.grid(True)
+        ax.tick_params(axis='x', labelrotation=45)
         
-    def plot_debt_ratio_radar(self):
-        """Plot financial ratios radar chart"""
-        available_companies = [company for company in self.companies if company in self.ratios]
-        if not available_companies:
-            print("No data available for radar chart")
-            return None
-            
-        latest_date = self.ratios[available_companies[0]].index[0]
-            
+    def _draw_radar(self, ax, available_companies):
+        """Draw the financial ratios radar chart on the given polar axes"""
+        import matplotlib
         categories = ['Debt to Assets', 'Current Ratio', 'Quick Ratio', 'Equity Multiplier']
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
         
         angles = np.linspace(0, 2*np.pi, len(categories), endpoint=False)
         angles = np.concatenate((angles, [angles[0]]))
         
-        colors = plt.cm.Set3(np.linspace(0, 1, len(available_companies)))
+        colors = matplotlib.colormaps['Set3'](np.linspace(0, 1, len(available_companies)))
         
-        for company, color in zip(available_companies, colors):
-            values = [
-                self.ratios[company]['Debt_to_Assets'][latest_date],
-                self.ratios[company]['Current_Ratio'][latest_date],
-                self.ratios[company]['Quick_Ratio'][latest_date],
-                self.ratios[company]['Equity_Multiplier'][latest_date]
-            ]
-            values = np.concatenate((values, [values[0]]))
-            
+        # Latest quarter for every company, reordered to match the categories
+        # and closed into polygons in one call
+        polygons = _radar_pad(np.stack([self.ratios_arr[company][0, [2, 0, 1, 3]]
+                                        for company in available_companies]))
+        
+        for company, color, values in zip(available_companies, colors, polygons):
             ax.plot(angles, values, 'o-', linewidth=2, color=color, label=company)
             ax.fill(angles, values, alpha=0.25, color=color)
             
@@ -145,14 +315,82 @@ class FinancialAnalysis:
         ax.set_xticklabels(categories, fontsize=10)
         ax.grid(True)
         
-        plt.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
-        plt.title('Financial Ratios Radar Chart', pad=20, fontsize=14)
+        ax.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
+        ax.set_title('Financial Ratios Radar Chart', pad=20, fontsize=14)
+        
+    def _draw_composition(self, ax1, ax2, company):
+        """Draw the assets and liabilities/equity pies for the latest date"""
+        import matplotlib
+        (current_assets, current_liabilities, _, _, _, equity,
+         non_current_assets, non_current_liabilities) = _gather_items(
+            self.balance_sheets[company],
+            ['Current Assets', 'Current Liabilities', 'Stockholders Equity',
+             'Total Non Current Assets',
+             'Total Non Current Liabilities Net Minority Interest'])[:, 0]  # Latest date
+        
+        # Assets composition
+        assets = {
+            'Current Assets': current_assets,
+            'Non-current Assets': non_current_assets
+        }
+        
+        ax1.pie(assets.values(), labels=assets.keys(), autopct='%1.1f%%', 
+               colors=matplotlib.colormaps['Pastel1'](np.linspace(0, 1, len(assets))))
+        ax1.set_title(f'{company} Assets Composition', pad=20)
+        
+        # Liabilities and Equity composition
+        liabilities_equity = {
+            'Current Liabilities': current_liabilities,
+            'Non-current Liabilities': non_current_liabilities,
+            "Shareholders' Equity": equity
+        }
+        
+        ax2.pie(liabilities_equity.values(), labels=liabilities_equity.keys(), 
+               autopct='%1.1f%%', colors=matplotlib.colormaps['Pastel2'](np.linspace(0, 1, len(liabilities_equity))))
+        ax2.set_title(f'{company} Liabilities and Equity Composition', pad=20)
+        
+    def plot_current_ratio_comparison(self):
+        """Plot current ratio comparison chart"""
+        fig = self.get_figure((12, 6))
+        self._draw_current_ratio(fig.add_subplot())
+        
+        fig.tight_layout()
+        
+        plot_path = self.get_plot_path('current_ratio_comparison.png')
+        fig.savefig(plot_path, dpi=150, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+        return plot_path
+        
+    def plot_debt_ratio_radar(self):
+        """Plot financial ratios radar chart"""
+        available_companies = [company for company in self.companies if company in self.ratios]
+        if not available_companies:
+            print("No data available for radar chart")
+            return None
+            
+        fig = self.get_figure((10, 10))
+        self._draw_radar(fig.add_subplot(projection='polar'), available_companies)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         plot_path = self.get_plot_path('debt_ratio_radar.png')
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(plot_path, dpi=150, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+        return plot_path
+
+    def plot_ratio_summary(self):
+        """Plot current ratio comparison and radar chart side by side in one figure"""
+        available_companies = [company for company in self.companies if company in self.ratios]
+        if not available_companies:
+            print("No data available for ratio summary")
+            return None
+            
+        fig = self.get_figure((22, 10))
+        self._draw_current_ratio(fig.add_subplot(1, 2, 1))
+        self._draw_radar(fig.add_subplot(1, 2, 2, projection='polar'), available_companies)
+        
+        fig.tight_layout()
+        
+        plot_path = self.get_plot_path('ratio_summary.png')
+        fig.savefig(plot_path, dpi=150, bbox_inches='tight', pil_kwargs={'compress_level': 1})
         return plot_path
 
     def plot_balance_sheet_composition(self, company):
@@ -162,108 +400,132 @@ class FinancialAnalysis:
             return None
             
         bs = self.balance_sheets[company]
-        latest_date = bs.columns[0]  # Use the latest date
+        latest_date = pd.Timestamp(bs.dates[0])  # Use the latest date
             
         try:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7))
+            fig = self.get_figure((15, 7))
+            ax1, ax2 = fig.subplots(1, 2)
+            self._draw_composition(ax1, ax2, company)
             
-            # Assets composition
-            total_assets = bs.loc['Total Assets'][latest_date]
-            current_assets = bs.loc['Current Assets'][latest_date]
-            non_current_assets = bs.loc['Total Non Current Assets'][latest_date]
+            fig.suptitle(f'{company} Balance Sheet Analysis ({latest_date.strftime("%Y-%m-%d")})', 
+                        fontsize=14, y=1.05)
             
-            assets = {
-                'Current Assets': current_assets,
-                'Non-current Assets': non_current_assets
-            }
+            fig.tight_layout()
+            
+            plot_path = self.get_plot_path(f'{company}_balance_sheet_composition.png')
+            fig.savefig(plot_path, dpi=150, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+            return plot_path
             
-            ax1.pie(assets.values(), labels=assets.keys(), autopct='%1.1f%%', 
-                   colors=plt.cm.Pastel1(np.linspace(0, 1, len(assets))))
-            ax1.set_title(f'{company} Assets Composition', pad=20)
+        except Exception as e:
+            print(f"Error plotting balance sheet composition for {company}: {str(e)}")
+            print("Available balance sheet items:")
+            print(bs.labels)
+            return None
+
+    def plot_dashboard(self, company):
+        """Plot balance sheet composition and ratio trends for one company in one figure"""
+        if company not in self.balance_sheets:
+            print(f"No data available for {company}")
+            return None
             
-            # Liabilities and Equity composition
-            total_liabilities = bs.loc['Total Liabilities Net Minority Interest'][latest_date]
-            current_liabilities = bs.loc['Current Liabilities'][latest_date]
-            non_current_liabilities = bs.loc['Total Non Current Liabilities Net Minority Interest'][latest_date]
-            equity = bs.loc['Stockholders Equity'][latest_date]
+        bs = self.balance_sheets[company]
+        latest_date = pd.Timestamp(bs.dates[0])  # Use the latest date
             
-            liabilities_equity = {
-                'Current Liabilities': current_liabilities,
-                'Non-current Liabilities': non_current_liabilities,
-                "Shareholders' Equity": equity
-            }
+        try:
+            fig = self.get_figure((16, 14))
+            axes = fig.subplots(2, 2)
+            self._draw_composition(axes[0, 0], axes[0, 1], company)
             
-            ax2.pie(liabilities_equity.values(), labels=liabilities_equity.keys(), 
-                   autopct='%1.1f%%', colors=plt.cm.Pastel2(np.linspace(0, 1, len(liabilities_equity))))
-            ax2.set_title(f'{company} Liabilities and Equity Composition', pad=20)
+            # Ratio trends, split into liquidity and leverage panels
+            ratio_panels = [
+                (axes[1, 0], 'Liquidity Ratios', ['Current_Ratio', 'Quick_Ratio']),
+                (axes[1, 1], 'Leverage Ratios', ['Debt_to_Assets', 'Equity_Multiplier'])
+            ]
+            for ax, title, columns in ratio_panels:
+                if company in self.ratios:
+                    ratios = self.ratios[company]
+                    for column in columns:
+                        ax.plot(ratios.index, ratios[column], marker='o',
+                                label=column.replace('_', ' '))
+                    ax.legend(fontsize=10)
+                ax.set_title(f'{company} {title}', pad=20)
+                ax.set_xlabel('Date', fontsize=12)
+                ax.grid(True)
+                ax.tick_params(axis='x', labelrotation=45)
             
-            plt.suptitle(f'{company} Balance Sheet Analysis ({latest_date.strftime("%Y-%m-%d")})', 
-                        fontsize=14, y=1.05)
+            fig.suptitle(f'{company} Financial Dashboard ({latest_date.strftime("%Y-%m-%d")})', 
+                        fontsize=14, y=1.02)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
-            plot_path = self.get_plot_path(f'{company}_balance_sheet_composition.png')
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            plot_path = self.get_plot_path(f'{company}_dashboard.png')
+            fig.savefig(plot_path, dpi=150, bbox_inches='tight', pil_kwargs={'compress_level': 1})
             return plot_path
             
         except Exception as e:
-            print(f"Error plotting balance sheet composition for {company}: {str(e)}")
+            print(f"Error plotting dashboard for {company}: {str(e)}")
             print("Available balance sheet items:")
-            print(bs.index.tolist())
+            print(bs.labels)
             return None
 
     def generate_analysis_report(self):
         """Generate analysis report"""
-        report = "Financial Analysis Report\n"
-        report += "=" * 50 + "\n\n"
+        parts = ["Financial Analysis Report\n"]
+        parts.append("=" * 50 + "\n\n")
         
-        report += f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        parts.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         
         for company in self.companies:
             if company not in self.ratios:
                 continue
                 
-            report += f"{company} Company Analysis\n"
-            report += "-" * 30 + "\n"
+            parts.append(f"{company} Company Analysis\n")
+            parts.append("-" * 30 + "\n")
             
             latest_date = self.ratios[company].index[0]
             latest_ratios = self.ratios[company].loc[latest_date]
             
-            report += f"Analysis Date: {latest_date}\n\n"
+            parts.append(f"Analysis Date: {latest_date}\n\n")
             
             # Add key ratios
-            report += "Key Financial Ratios:\n"
-            report += f"1. Current Ratio: {latest_ratios['Current_Ratio']:.2f}\n"
-            report += "   - Measures short-term liquidity, 2:1 is generally considered reasonable\n"
-            report += f"2. Quick Ratio: {latest_ratios['Quick_Ratio']:.2f}\n"
-            report += "   - Measures immediate liquidity, 1:1 is generally considered reasonable\n"
-            report += f"3. Debt to Assets Ratio: {latest_ratios['Debt_to_Assets']:.2%}\n"
-            report += "   - Measures long-term solvency, below 70% is generally considered safe\n"
-            report += f"4. Equity Multiplier: {latest_ratios['Equity_Multiplier']:.2f}\n"
-            report += "   - Measures financial leverage, higher values indicate higher leverage\n\n"
+            parts.append("Key Financial Ratios:\n")
+            parts.append(f"1. Current Ratio: {latest_ratios['Current_Ratio']:.2f}\n")
+            parts.append("   - Measures short-term liquidity, 2:1 is generally considered reasonable\n")
+            parts.append(f"2. Quick Ratio: {latest_ratios['Quick_Ratio']:.2f}\n")
+            parts.append("   - Measures immediate liquidity, 1:1 is generally considered reasonable\n")
+            parts.append(f"3. Debt to Assets Ratio: {latest_ratios['Debt_to_Assets']:.2%}\n")
+            parts.append("   - Measures long-term solvency, below 70% is generally considered safe\n")
+            parts.append(f"4. Equity Multiplier: {latest_ratios['Equity_Multiplier']:.2f}\n")
+            parts.append("   - Measures financial leverage, higher values indicate higher leverage\n\n")
             
             # Add trend analysis
-            report += "Trend Analysis:\n"
+            parts.append("Trend Analysis:\n")
             try:
                 for ratio in ['Current_Ratio', 'Debt_to_Assets']:
-                    trend = self.ratios[company][ratio].pct_change().mean()
-                    report += f"{ratio} Average Change Rate: {trend:.2%}\n"
+                    values = self.ratios[company][ratio].to_numpy()
+                    trend = np.nan
+                    if len(values) >= 2:
+                        # Zero or infinite ratios give inf/NaN changes, as pct_change did
+                        with np.errstate(divide='ignore', invalid='ignore'):
+                            changes = np.diff(values) / values[:-1]
+                        if not np.isnan(changes).all():
+                            trend = np.nanmean(changes)
+                    parts.append(f"{ratio} Average Change Rate: {trend:.2%}\n")
             except Exception as e:
-                report += f"Unable to calculate trends: {str(e)}\n"
+                parts.append(f"Unable to calculate trends: {str(e)}\n")
             
-            report += "\n"
+            parts.append("\n")
             
             # Add recommendations
-            report += "Recommendations:\n"
+            parts.append("Recommendations:\n")
             if latest_ratios['Current_Ratio'] < 2:
-                report += "- Monitor short-term liquidity position\n"
+                parts.append("- Monitor short-term liquidity position\n")
             if latest_ratios['Debt_to_Assets'] > 0.7:
-                report += "- High debt ratio, monitor long-term solvency risk\n"
+                parts.append("- High debt ratio, monitor long-term solvency risk\n")
             
-            report += "\n" + "=" * 50 + "\n\n"
+            parts.append("\n" + "=" * 50 + "\n\n")
         
-        return report
+        return "".join(parts)
 
 def main():
     # Set companies to analyze
@@ -281,21 +543,18 @@ def main():
         
         print("\nGenerating visualizations...")
         
-        print("- Generating current ratio comparison...")
-        current_ratio_path = analysis.plot_current_ratio_comparison()
-        if current_ratio_path:
-            print(f"  Saved: {current_ratio_path}")
-        
-        print("- Generating financial ratios radar chart...")
-        radar_path = analysis.plot_debt_ratio_radar()
-        if radar_path:
-            print(f"  Saved: {radar_path}")
+        # One summary figure plus one dashboard per company keeps the number of
+        # saved images low; all of them are drawn on the shared figure
+        print("- Generating financial ratios summary...")
+        summary_path = analysis.plot_ratio_summary()
+        if summary_path:
+            print(f"  Saved: {summary_path}")
         
-        print("- Generating balance sheet composition charts...")
+        print("- Generating company dashboards...")
         for company in companies:
-            composition_path = analysis.plot_balance_sheet_composition(company)
-            if composition_path:
-                print(f"  Saved {company} balance sheet composition: {composition_path}")
+            dashboard_path = analysis.plot_dashboard(company)
+            if dashboard_path:
+                print(f"  Saved {company} dashboard: {dashboard_path}")
         
         print("\nGenerating analysis report...")
         report = analysis.generate_analysis_report()
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+def _inputs(n):
+    rng = np.random.default_rng(0)
+    a = rng.uniform(1e9, 1e11, (n, 6)).astype(np.float32)
+    a[0, 1] = 0        # Zero current liabilities
+    a[1, 3] = 0        # Zero total assets
+    a[2, 5] = 0        # Zero stockholders equity
+    a[3, 0] = 0        # 0 / 0 current ratio
+    a[3, 1] = 0
+    a[4, 2] = np.nan   # Missing inventory
+    a[5, 4] = np.nan   # Missing total liabilities
+    return a
+
+
+def test_jit_matches_numpy_with_zero_and_nan_inputs():
+    if main._ratios_jit() is None:
+        pytest.skip("numba is not installed")
+    a = _inputs(main.JIT_MIN_ROWS)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = main._ratios_numpy(a)
+    np.testing.assert_allclose(main._ratios_jit()(a), expected, rtol=1e-6)
+    np.testing.assert_allclose(main._ratios_kernel(a), expected, rtol=1e-6)
+
+
+def test_kernel_returns_inf_and_nan_for_small_inputs():
+    ratios = main._ratios_kernel(_inputs(12))
+    assert np.isinf(ratios[0, 0])
+    assert np.isinf(ratios[1, 2])
+    assert np.isinf(ratios[2, 3])
+    assert np.isnan(ratios[3, 0])
+    assert np.isnan(ratios[4, 1])
+    assert np.isnan(ratios[5, 2])